@@ -2,6 +2,7 @@ from flask import Flask, render_template, session
 from config import config
 import os
 from utils.db import init_db
+import click
 
 def create_app(config_name='default'):
     """Application factory function"""
@@ -33,6 +34,17 @@ def create_app(config_name='default'):
         """Landing page"""
         return render_template('index.html')
     
+    # CLI commands
+    @app.cli.command('rebuild-sentiment')
+    @click.argument('start', type=click.DateTime(formats=['%Y-%m-%d']))
+    @click.argument('end', type=click.DateTime(formats=['%Y-%m-%d']))
+    def rebuild_sentiment(start, end):
+        """Recompute sentiment rollups for days START up to END (UTC)"""
+        from models.article import SentimentRollup
+        
+        counted = SentimentRollup.rebuild(start, end)
+        click.echo(f"Rebuilt sentiment rollups from {counted} articles")
+    
     return app
 
 if __name__ == '__main__':
@@ -0,0 +1,277 @@
+from utils.db import get_db
+from pymongo import ReplaceOne, ReturnDocument
+from dateutil import parser as date_parser
+import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+SENTIMENTS = ['Positive', 'Negative', 'Neutral']
+
+# Rollup collections keyed by granularity
+ROLLUP_COLLECTIONS = {
+    'hour': 'sentiment_rollups_hourly',
+    'day': 'sentiment_rollups_daily'
+}
+
+
+def _to_utc(value):
+    """
+    Parse a NewsAPI timestamp into a naive UTC datetime
+
+    Returns None when the timestamp is missing or unparseable. Results are
+    truncated to milliseconds to match what MongoDB stores.
+    """
+    if isinstance(value, datetime.datetime):
+        published = value
+    else:
+        try:
+            published = date_parser.isoparse(value)
+        except (TypeError, ValueError):
+            return None
+
+    if published.tzinfo is not None:
+        published = published.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return published.replace(microsecond=published.microsecond // 1000 * 1000)
+
+
+def _bucket_start(moment, granularity):
+    """Truncate a datetime to the start of its hourly or daily bucket"""
+    if granularity == 'hour':
+        return moment.replace(minute=0, second=0, microsecond=0)
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class SentimentRollup:
+    """Precomputed sentiment counts per time bucket, category and source"""
+
+    @staticmethod
+    def increment(category, source, published_at, sentiment, delta=1):
+        """Apply a count change to the hourly and daily buckets of an article"""
+        db = get_db()
+        key = sentiment.lower()
+
+        for granularity, collection in ROLLUP_COLLECTIONS.items():
+            db[collection].update_one(
+                {
+                    'category': category,
+                    'source': source,
+                    'bucket': _bucket_start(published_at, granularity)
+                },
+                {'$inc': {f'counts.{key}': delta, 'total': delta}},
+                upsert=True
+            )
+
+    @staticmethod
+    def rebuild(start, end):
+        """
+        Recompute rollups from the articles collection for whole days
+
+        Repairs buckets left inconsistent by a partially failed
+        Article.record. The range is widened to full UTC days and processed
+        one day at a time, so memory stays bounded to a single day's buckets.
+        Each rebuilt bucket is replaced in place and stale buckets in the day
+        are zeroed, so the range is never left partly deleted. An increment
+        that lands while a day is being rebuilt can still be overwritten;
+        pause writes during the rebuild when exact counts are required.
+
+        Args:
+            start (datetime): Start of the range (UTC)
+            end (datetime): End of the range (UTC)
+
+        Returns:
+            int: Number of articles counted
+        """
+        start = _bucket_start(start, 'day')
+        if end != _bucket_start(end, 'day'):
+            end = _bucket_start(end, 'day') + datetime.timedelta(days=1)
+
+        counted = 0
+        day = start
+        while day < end:
+            next_day = day + datetime.timedelta(days=1)
+            counted += SentimentRollup._rebuild_day(day, next_day)
+            day = next_day
+
+        logger.info(f"Rebuilt sentiment rollups from {counted} articles")
+        return counted
+
+    @staticmethod
+    def _rebuild_day(start, end):
+        """Rebuild the hourly and daily buckets of a single UTC day"""
+        db = get_db()
+        buckets = {granularity: {} for granularity in ROLLUP_COLLECTIONS}
+        counted = 0
+        for article in db.articles.find({'published_at': {'$gte': start, '$lt': end}}):
+            counted += 1
+            key = article['sentiment'].lower()
+            for granularity, docs in buckets.items():
+                bucket = _bucket_start(article['published_at'], granularity)
+                doc = docs.setdefault(
+                    (article['category'], article['source'], bucket),
+                    {
+                        'category': article['category'],
+                        'source': article['source'],
+                        'bucket': bucket,
+                        'counts': {},
+                        'total': 0
+                    }
+                )
+                doc['counts'][key] = doc['counts'].get(key, 0) + 1
+                doc['total'] += 1
+
+        for granularity, collection in ROLLUP_COLLECTIONS.items():
+            docs = buckets[granularity]
+            if docs:
+                db[collection].bulk_write([
+                    ReplaceOne({'category': category, 'source': source, 'bucket': bucket},
+                               doc, upsert=True)
+                    for (category, source, bucket), doc in docs.items()
+                ], ordered=False)
+
+            # Zero buckets that no longer have any articles behind them
+            stale = [
+                existing['_id']
+                for existing in db[collection].find(
+                    {'bucket': {'$gte': start, '$lt': end}},
+                    {'category': 1, 'source': 1, 'bucket': 1}
+                )
+                if (existing['category'], existing['source'], existing['bucket']) not in docs
+            ]
+            if stale:
+                db[collection].update_many(
+                    {'_id': {'$in': stale}},
+                    {'$set': {'counts': {}, 'total': 0}}
+                )
+
+        return counted
+
+    @staticmethod
+    def query(start, end, granularity='day', category=None, source=None):
+        """
+        Sum rollup buckets between start (inclusive) and end (exclusive)
+
+        Args:
+            start (datetime): Start of the range (UTC)
+            end (datetime): End of the range (UTC)
+            granularity (str): "hour" or "day"
+            category (str): Optional category filter
+            source (str): Optional source filter
+
+        Without a category, search results are excluded because they
+        duplicate articles already recorded under a headline category. An
+        article that appears in several headline categories is still counted
+        once per category.
+
+        Returns:
+            dict: Per-bucket series and totals for the range
+        """
+        db = get_db()
+        match = {
+            'bucket': {
+                '$gte': _bucket_start(start, granularity),
+                '$lt': end
+            }
+        }
+        if category:
+            match['category'] = category
+        else:
+            match['category'] = {'$ne': 'search'}
+        if source:
+            match['source'] = source
+
+        pipeline = [
+            {'$match': match},
+            {'$group': {
+                '_id': '$bucket',
+                'positive': {'$sum': '$counts.positive'},
+                'negative': {'$sum': '$counts.negative'},
+                'neutral': {'$sum': '$counts.neutral'},
+                'total': {'$sum': '$total'}
+            }},
+            {'$sort': {'_id': 1}}
+        ]
+
+        series = []
+        totals = {'positive': 0, 'negative': 0, 'neutral': 0, 'total': 0}
+        for row in db[ROLLUP_COLLECTIONS[granularity]].aggregate(pipeline):
+            point = {
+                'bucket': row['_id'].isoformat() + 'Z',
+                'positive': row['positive'],
+                'negative': row['negative'],
+                'neutral': row['neutral'],
+                'total': row['total']
+            }
+            series.append(point)
+            for key in totals:
+                totals[key] += point[key]
+
+        return {'series': series, 'totals': totals}
+
+
+class Article:
+    """Enriched article model for MongoDB"""
+
+    @staticmethod
+    def record(article):
+        """
+        Store an enriched article and keep the sentiment rollups in sync
+
+        Articles are keyed by URL and category, so re-fetching the same
+        headline only touches the rollups when its sentiment, source or
+        hourly bucket changes. An article without a usable publishedAt keeps
+        the timestamp it was first recorded with.
+
+        The article upsert and rollup updates are separate writes, so a
+        failure in between leaves the rollups off by one until
+        SentimentRollup.rebuild (the `flask rebuild-sentiment` command) is
+        run for that range.
+
+        Args:
+            article (dict): Article with 'sentiment', 'category' and 'source'
+        """
+        url = article.get('url')
+        sentiment = article.get('sentiment')
+        if not url or url == '#' or sentiment not in SENTIMENTS:
+            return
+
+        db = get_db()
+        category = article.get('category', 'general')
+        source = article.get('source') or 'Unknown'
+        published_at = _to_utc(article.get('publishedAt'))
+        now = _to_utc(datetime.datetime.utcnow())
+
+        fields = {
+            'title': article.get('title'),
+            'source': source,
+            'sentiment': sentiment,
+            'updated_at': now
+        }
+        on_insert = {'recorded_at': now}
+        if published_at is not None:
+            fields['published_at'] = published_at
+        else:
+            on_insert['published_at'] = now
+
+        previous = db.articles.find_one_and_update(
+            {'url': url, 'category': category},
+            {'$set': fields, '$setOnInsert': on_insert},
+            upsert=True,
+            return_document=ReturnDocument.BEFORE
+        )
+
+        if previous is None:
+            SentimentRollup.increment(category, source,
+                                      published_at or now, sentiment)
+            return
+
+        if published_at is None:
+            published_at = previous['published_at']
+
+        old_key = (previous['sentiment'], previous['source'],
+                   _bucket_start(previous['published_at'], 'hour'))
+        if old_key != (sentiment, source, _bucket_start(published_at, 'hour')):
+            SentimentRollup.increment(category, previous['source'],
+                                      previous['published_at'],
+                                      previous['sentiment'], -1)
+            SentimentRollup.increment(category, source, published_at, sentiment)
@@ -2,6 +2,8 @@ from flask import Blueprint, render_template, request, jsonify, session, make_re
 from routes.auth import login_required, no_cache
 from utils.news_fetcher import NewsFetcher
 from utils.gemini_ai import GeminiAI
+from models.article import Article, SentimentRollup
+import datetime
 import logging
 
 news_bp = Blueprint('news', __name__)
@@ -14,6 +16,16 @@ CATEGORIES = [
     'entertainment', 'health', 'science', 'politics', 'world', 'local'
 ]
 
+# Longest range each rollup granularity may be queried over
+MAX_ANALYTICS_DAYS = {'hour': 14, 'day': 365}
+
+def record_article(article):
+    """Persist an enriched article without failing the request"""
+    try:
+        Article.record(article)
+    except Exception as e:
+        logging.error(f"Error recording article: {str(e)}")
+
 @news_bp.route('/dashboard')
 @login_required
 @no_cache
@@ -57,11 +69,15 @@ def get_news_by_category(category):
                 enhanced_article = {
                     **article,
                     'ai_summary': summary,
-                    'sentiment': sentiment,
+                    'sentiment': sentiment or 'Neutral',
                     'category': category
                 }
                 enhanced_articles.append(enhanced_article)
                 
+                # Only record articles the AI actually analyzed
+                if sentiment:
+                    record_article(enhanced_article)
+                
             except Exception as e:
                 logging.error(f"Error enhancing article: {str(e)}")
                 # Add fallback article without AI features
@@ -105,11 +121,14 @@ def search_news():
                 enhanced_article = {
                     **article,
                     'ai_summary': summary,
-                    'sentiment': sentiment,
+                    'sentiment': sentiment or 'Neutral',
                     'category': 'search'
                 }
                 enhanced_articles.append(enhanced_article)
                 
+                if sentiment:
+                    record_article(enhanced_article)
+                
             except Exception as e:
                 logging.error(f"Error enhancing search article: {str(e)}")
                 enhanced_article = {
@@ -124,4 +143,44 @@ def search_news():
         
     except Exception as e:
         logging.error(f"Error searching news: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@news_bp.route('/analytics/sentiment')
+@login_required
+@no_cache
+def sentiment_analytics():
+    """Sentiment trends read from precomputed rollups (AJAX endpoint)"""
+    try:
+        granularity = request.args.get('granularity', 'day')
+        if granularity not in MAX_ANALYTICS_DAYS:
+            return jsonify({'error': 'Invalid granularity'}), 400
+        
+        # Without a category, all headline categories are summed (search excluded)
+        category = request.args.get('category') or None
+        if category and category not in CATEGORIES + ['search']:
+            return jsonify({'error': 'Invalid category'}), 400
+        
+        source = request.args.get('source') or None
+        
+        try:
+            days = int(request.args.get('days', 7))
+        except ValueError:
+            return jsonify({'error': 'Invalid number of days'}), 400
+        days = max(1, min(days, MAX_ANALYTICS_DAYS[granularity]))
+        
+        end = datetime.datetime.utcnow()
+        start = end - datetime.timedelta(days=days)
+        trends = SentimentRollup.query(start, end, granularity=granularity,
+                                       category=category, source=source)
+        
+        return jsonify({
+            'granularity': granularity,
+            'days': days,
+            'category': category,
+            'source': source,
+            **trends
+        })
+        
+    except Exception as e:
+        logging.error(f"Error fetching sentiment analytics: {str(e)}")
         return jsonify({'error': str(e)}), 500
\ No newline at end of file
@@ -21,6 +21,14 @@ class NewsDashboard {
             });
         }
 
+        // Sentiment trend range change
+        const trendRange = document.getElementById('trendRange');
+        if (trendRange) {
+            trendRange.addEventListener('change', () => {
+                this.loadSentimentTrends(this.trendCategory);
+            });
+        }
+
         // Search button click
         const searchButton = document.getElementById('searchButton');
         if (searchButton) {
@@ -50,6 +58,7 @@ class NewsDashboard {
     async loadNews(category) {
         if (this.isLoading) return;
         
+        this.currentCategory = category;
         this.showLoading();
         this.hideError();
         this.hideEmptyState();
@@ -69,6 +78,8 @@ class NewsDashboard {
             this.showError(error.message);
         } finally {
             this.hideLoading();
+            // Refresh after the fetch so newly analyzed articles are counted
+            this.loadSentimentTrends();
         }
     }
 
@@ -109,7 +120,79 @@ class NewsDashboard {
             this.showError(error.message);
         } finally {
             this.hideLoading();
+            this.loadSentimentTrends('search');
+        }
+    }
+
+    async loadSentimentTrends(category = this.currentCategory) {
+        const trendRange = document.getElementById('trendRange');
+        if (!trendRange) return;
+
+        this.trendCategory = category;
+        const trendCategory = document.getElementById('trendCategory');
+        if (trendCategory) trendCategory.textContent = category;
+
+        const [granularity, days] = trendRange.value.split(':');
+        const params = new URLSearchParams({
+            category,
+            granularity,
+            days
+        });
+
+        try {
+            const response = await fetch(`/analytics/sentiment?${params}`);
+            const data = await response.json();
+
+            if (!response.ok) {
+                throw new Error(data.error || 'Failed to fetch sentiment trends');
+            }
+
+            this.displaySentimentTrends(data);
+
+        } catch (error) {
+            console.error('Error loading sentiment trends:', error);
+            const chart = document.getElementById('sentimentChart');
+            if (chart) chart.innerHTML = '<p class="sentiment-empty">Sentiment trends unavailable</p>';
+        }
+    }
+
+    displaySentimentTrends(data) {
+        const totalsDiv = document.getElementById('sentimentTotals');
+        const chart = document.getElementById('sentimentChart');
+        if (!totalsDiv || !chart) return;
+
+        const { totals, series } = data;
+        const percent = (count, total) => total ? Math.round((count / total) * 100) : 0;
+
+        totalsDiv.innerHTML = `
+            <span class="sentiment-tag sentiment-positive">🟢 ${totals.positive} (${percent(totals.positive, totals.total)}%)</span>
+            <span class="sentiment-tag sentiment-negative">🔴 ${totals.negative} (${percent(totals.negative, totals.total)}%)</span>
+            <span class="sentiment-tag sentiment-neutral">🟡 ${totals.neutral} (${percent(totals.neutral, totals.total)}%)</span>
+        `;
+
+        if (!series.length) {
+            chart.innerHTML = '<p class="sentiment-empty">No sentiment data for this period yet</p>';
+            return;
         }
+
+        chart.innerHTML = series.map(point => {
+            const date = new Date(point.bucket);
+            // Daily buckets start at UTC midnight, so label them in UTC
+            const label = data.granularity === 'hour'
+                ? date.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' })
+                : date.toLocaleDateString([], { month: 'short', day: 'numeric', timeZone: 'UTC' });
+
+            return `
+                <div class="sentiment-bar" title="${label}: ${point.positive} positive, ${point.negative} negative, ${point.neutral} neutral">
+                    <div class="sentiment-bar-stack">
+                        <div class="sentiment-positive" style="height: ${percent(point.positive, point.total)}%"></div>
+                        <div class="sentiment-neutral" style="height: ${percent(point.neutral, point.total)}%"></div>
+                        <div class="sentiment-negative" style="height: ${percent(point.negative, point.total)}%"></div>
+                    </div>
+                    <span class="sentiment-bar-label">${label}</span>
+                </div>
+            `;
+        }).join('');
     }
 
     displayArticles(articles, title = null) {
@@ -0,0 +1,16 @@
+import os
+import sys
+
+import mongomock
+import pytest
+
+# Make app modules importable when running pytest from the project root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """In-memory MongoDB patched in place of the app connection"""
+    database = mongomock.MongoClient().news_db
+    monkeypatch.setattr('models.article.get_db', lambda: database)
+    return database
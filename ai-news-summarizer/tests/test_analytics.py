@@ -0,0 +1,78 @@
+import datetime
+
+import pytest
+from flask import Flask
+
+from models.article import Article
+from routes.auth import auth_bp
+from routes.news import news_bp, MAX_ANALYTICS_DAYS
+
+
+@pytest.fixture
+def client(db):
+    app = Flask(__name__)
+    app.config.update(SECRET_KEY='test', TESTING=True)
+    app.register_blueprint(auth_bp)
+    app.register_blueprint(news_bp)
+
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 'user'
+    return client
+
+
+def test_requires_login(db):
+    app = Flask(__name__)
+    app.config.update(SECRET_KEY='test')
+    app.register_blueprint(auth_bp)
+    app.register_blueprint(news_bp)
+
+    response = app.test_client().get('/analytics/sentiment')
+
+    assert response.status_code == 302
+
+
+def test_returns_trends_for_category(client):
+    published = datetime.datetime.utcnow() - datetime.timedelta(hours=1)
+    Article.record({
+        'url': 'https://example.com/markets',
+        'source': 'Reuters',
+        'publishedAt': published.isoformat() + 'Z',
+        'sentiment': 'Negative',
+        'category': 'business'
+    })
+
+    response = client.get('/analytics/sentiment?category=business&days=3')
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['granularity'] == 'day'
+    assert data['days'] == 3
+    assert data['category'] == 'business'
+    assert data['source'] is None
+    assert data['totals'] == {'positive': 0, 'negative': 1, 'neutral': 0, 'total': 1}
+    assert len(data['series']) == 1
+
+
+@pytest.mark.parametrize('granularity,days,expected', [
+    ('day', 1000, MAX_ANALYTICS_DAYS['day']),
+    ('hour', 90, MAX_ANALYTICS_DAYS['hour']),
+    ('day', -5, 1),
+])
+def test_days_are_clamped(client, granularity, days, expected):
+    response = client.get(f'/analytics/sentiment?granularity={granularity}&days={days}')
+
+    assert response.status_code == 200
+    assert response.get_json()['days'] == expected
+
+
+@pytest.mark.parametrize('query,error', [
+    ('granularity=minute', 'Invalid granularity'),
+    ('category=gossip', 'Invalid category'),
+    ('days=week', 'Invalid number of days'),
+])
+def test_rejects_invalid_parameters(client, query, error):
+    response = client.get(f'/analytics/sentiment?{query}')
+
+    assert response.status_code == 400
+    assert response.get_json()['error'] == error
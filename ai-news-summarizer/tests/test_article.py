@@ -0,0 +1,158 @@
+import datetime
+
+from models.article import Article, SentimentRollup
+
+
+def make_article(**overrides):
+    article = {
+        'title': 'Markets rally',
+        'url': 'https://example.com/markets',
+        'source': 'Reuters',
+        'publishedAt': '2025-10-20T14:35:27.1234567Z',
+        'sentiment': 'Positive',
+        'category': 'business'
+    }
+    article.update(overrides)
+    return article
+
+
+def rollups(db, granularity):
+    collection = db[f'sentiment_rollups_{granularity}']
+    return {
+        (doc['source'], doc['bucket']): (doc['counts'], doc['total'])
+        for doc in collection.find()
+        if doc['total']
+    }
+
+
+def test_new_article_increments_hourly_and_daily(db):
+    Article.record(make_article())
+
+    assert rollups(db, 'hourly') == {
+        ('Reuters', datetime.datetime(2025, 10, 20, 14)): ({'positive': 1}, 1)
+    }
+    assert rollups(db, 'daily') == {
+        ('Reuters', datetime.datetime(2025, 10, 20)): ({'positive': 1}, 1)
+    }
+
+
+def test_unchanged_refetch_does_not_touch_rollups(db):
+    Article.record(make_article())
+    before = list(db.sentiment_rollups_hourly.find())
+
+    Article.record(make_article())
+
+    assert list(db.sentiment_rollups_hourly.find()) == before
+    assert db.articles.count_documents({}) == 1
+
+
+def test_sentiment_flip_moves_count(db):
+    Article.record(make_article())
+    Article.record(make_article(sentiment='Negative'))
+
+    counts, total = rollups(db, 'hourly')[('Reuters', datetime.datetime(2025, 10, 20, 14))]
+    assert counts == {'positive': 0, 'negative': 1}
+    assert total == 1
+
+
+def test_source_change_moves_count_between_sources(db):
+    Article.record(make_article())
+    Article.record(make_article(source='Bloomberg'))
+
+    assert rollups(db, 'hourly') == {
+        ('Bloomberg', datetime.datetime(2025, 10, 20, 14)): ({'positive': 1}, 1)
+    }
+    old_bucket = db.sentiment_rollups_daily.find_one({'source': 'Reuters'})
+    assert old_bucket['counts'] == {'positive': 0}
+    assert old_bucket['total'] == 0
+
+
+def test_missing_published_at_keeps_original_bucket(db):
+    Article.record(make_article(publishedAt=None))
+    stored = db.articles.find_one()['published_at']
+    before = rollups(db, 'hourly')
+
+    Article.record(make_article(publishedAt=''))
+
+    assert db.articles.find_one()['published_at'] == stored
+    assert rollups(db, 'hourly') == before
+    assert sum(total for _, total in before.values()) == 1
+
+
+def test_unanalyzed_article_is_not_recorded(db):
+    Article.record(make_article(sentiment=None))
+
+    assert db.articles.count_documents({}) == 0
+    assert db.sentiment_rollups_hourly.count_documents({}) == 0
+
+
+def test_rebuild_repairs_drifted_rollups(db):
+    Article.record(make_article())
+    Article.record(make_article(url='https://example.com/other', sentiment='Negative'))
+    db.sentiment_rollups_daily.update_many({}, {'$inc': {'total': 5}})
+
+    counted = SentimentRollup.rebuild(datetime.datetime(2025, 10, 20),
+                                      datetime.datetime(2025, 10, 21))
+
+    assert counted == 2
+    assert db.sentiment_rollups_daily.count_documents({}) == 1
+    trends = SentimentRollup.query(datetime.datetime(2025, 10, 20),
+                                   datetime.datetime(2025, 10, 21),
+                                   category='business')
+    assert trends['totals'] == {'positive': 1, 'negative': 1, 'neutral': 0, 'total': 2}
+
+
+def test_rebuild_replaces_live_buckets_and_zeroes_stale_ones(db):
+    db.sentiment_rollups_hourly.create_index(
+        [('category', 1), ('source', 1), ('bucket', 1)], unique=True)
+    Article.record(make_article())
+    Article.record(make_article(url='https://example.com/gone', source='AP'))
+    db.articles.delete_one({'url': 'https://example.com/gone'})
+
+    SentimentRollup.rebuild(datetime.datetime(2025, 10, 20),
+                            datetime.datetime(2025, 10, 20, 12))
+
+    assert rollups(db, 'hourly') == {
+        ('Reuters', datetime.datetime(2025, 10, 20, 14)): ({'positive': 1}, 1)
+    }
+    assert db.sentiment_rollups_hourly.find_one({'source': 'AP'})['total'] == 0
+
+
+def test_query_hourly_with_source_filter(db):
+    Article.record(make_article())
+    Article.record(make_article(url='https://example.com/late',
+                                publishedAt='2025-10-20T15:05:00Z',
+                                sentiment='Neutral'))
+    Article.record(make_article(url='https://example.com/ap', source='AP'))
+
+    trends = SentimentRollup.query(datetime.datetime(2025, 10, 20, 14, 30),
+                                   datetime.datetime(2025, 10, 21),
+                                   granularity='hour', source='Reuters')
+
+    assert [point['bucket'] for point in trends['series']] == [
+        '2025-10-20T14:00:00Z', '2025-10-20T15:00:00Z'
+    ]
+    assert trends['totals'] == {'positive': 1, 'negative': 0, 'neutral': 1, 'total': 2}
+
+
+def test_query_without_category_excludes_search(db):
+    Article.record(make_article())
+    Article.record(make_article(category='search'))
+
+    trends = SentimentRollup.query(datetime.datetime(2025, 10, 20),
+                                   datetime.datetime(2025, 10, 21))
+
+    assert trends['totals']['total'] == 1
+
+
+def test_rebuild_sentiment_command(db, monkeypatch):
+    import app as app_module
+
+    monkeypatch.setattr(app_module, 'init_db', lambda app: None)
+    Article.record(make_article())
+
+    runner = app_module.create_app().test_cli_runner()
+    result = runner.invoke(args=['rebuild-sentiment', '2025-10-20', '2025-10-21'])
+
+    assert result.exit_code == 0
+    assert 'Rebuilt sentiment rollups from 1 articles' in result.output
@@ -1,7 +1,10 @@
 from pymongo import MongoClient
+from pymongo.errors import OperationFailure
 from flask import g
 import os
 
+HOURLY_ROLLUP_TTL = 30 * 24 * 60 * 60
+
 def get_db():
     """Get database connection from context"""
     if 'db' not in g:
@@ -15,6 +18,27 @@ def init_db(app):
         # Create indexes
         db.users.create_index('email', unique=True)
         db.users.create_index('username', unique=True)
+        db.articles.create_index([('url', 1), ('category', 1)], unique=True)
+        db.articles.create_index([('published_at', 1)])
+
+        # Rollup indexes keep trend queries proportional to buckets, not articles
+        for collection in ('sentiment_rollups_hourly', 'sentiment_rollups_daily'):
+            db[collection].create_index(
+                [('category', 1), ('source', 1), ('bucket', 1)], unique=True)
+            db[collection].create_index([('source', 1), ('bucket', 1)])
+        
+        db.sentiment_rollups_daily.create_index([('bucket', 1)])
+        
+        # Hourly buckets are only queried for 14 days, so expire them after 30
+        try:
+            db.sentiment_rollups_hourly.create_index(
+                [('bucket', 1)], expireAfterSeconds=HOURLY_ROLLUP_TTL)
+        except OperationFailure:
+            # Upgrade a bucket index created before the TTL was added
+            db.command('collMod', 'sentiment_rollups_hourly', index={
+                'keyPattern': {'bucket': 1},
+                'expireAfterSeconds': HOURLY_ROLLUP_TTL
+            })
         
         print("Database initialized successfully")
 
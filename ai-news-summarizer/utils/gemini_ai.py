@@ -71,10 +71,11 @@ Summary:"""
             max_retries (int): Maximum number of retry attempts
             
         Returns:
-            str: "Positive", "Negative", or "Neutral"
+            str: "Positive", "Negative", or "Neutral", or None if the
+                sentiment could not be determined
         """
         if not self.api_key:
-            return "Neutral"
+            return None
         
         # Prepare content for sentiment analysis
         content_to_analyze = article_content or "No content available"
@@ -105,4 +106,4 @@ Sentiment:"""
                     time.sleep(2)
                 continue
         
-        return "Neutral"  # Default fallback
\ No newline at end of file
+        return None  # Callers decide how to display unanalyzed articles
\ No newline at end of file